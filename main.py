@@ -134,6 +134,7 @@ class FrankaAutomation:
             
             # Initialize robot
             self.robot.navigate_and_login()
+            self.commands.clear_element_cache()
             self.robot.ensure_joints_unlocked()
             
             self._is_initialized = True
@@ -262,10 +263,11 @@ class FrankaAutomation:
         success = True
         
         if setup_network:
-            if not self.network_manager.configure_network():
+            configured, reachable = self.network_manager.bootstrap()
+            if not configured:
                 success = False
             
-            if not self.network_manager.test_robot_connectivity():
+            if not reachable:
                 self.logger.warning("Robot connectivity test failed, but continuing...")
         
         return success
@@ -297,6 +299,7 @@ class FrankaAutomation:
                 
                 # Initialize robot
                 self.robot.navigate_and_login()
+                self.commands.clear_element_cache()
                 self.robot.ensure_joints_unlocked()
                 
                 if self.killer and self.killer.kill_now:
@@ -448,11 +451,8 @@ Interactive shell usage:
     if args.setup_network:
         network_manager = NetworkManager(config, logger)
         
-        if network_manager.configure_network():
-            network_manager.test_robot_connectivity()
-            return 0
-        else:
-            return 1
+        configured, _ = network_manager.bootstrap()
+        return 0 if configured else 1
     
     # Run automation
     automation = FrankaAutomation(config)
@@ -13,6 +13,8 @@ class Config:
     local_ip: str = "172.16.0.1"
     network_interface: str = "enp2s0"
     subnet: str = "24"
+    robot_port: int = 443  # Desk web interface (HTTPS)
+    ping_connectivity_check: bool = False  # Probe with ICMP ping instead of TCP
     
     # Robot authentication
     username: str = "Panda"
@@ -20,7 +22,6 @@ class Config:
     
     # Timeouts (seconds)
     short_timeout: int = 3
-    default_timeout: int = 10
     long_timeout: int = 10
     
     # Chrome profile settings
@@ -1,9 +1,47 @@
 """Network configuration management for robot communication."""
 
+import os
+import json
+import time
+import errno
+import ipaddress
+import socket
 import subprocess
 import logging
+from typing import Dict, List, Optional, Set, Tuple
 from .config import Config
 
+try:
+    from pyroute2 import IPRoute
+    from pyroute2.netlink.exceptions import NetlinkError
+except ImportError:  # Optional: fall back to `sudo ip addr add`
+    IPRoute = None
+    NetlinkError = OSError
+
+# How long the probed interface table is trusted before re-running `ip addr show`
+CONFIG_CACHE_TTL = 30.0
+
+# TCP connect timeout for the robot reachability probe
+CONNECT_PROBE_TIMEOUT = 1.0
+
+IFACE_TABLE_CMD = ["ip", "-j", "-f", "inet", "addr", "show"]
+
+CAP_NET_ADMIN = 12
+
+
+def has_cap_net_admin() -> bool:
+    """Check whether this process may change interface addresses without sudo."""
+    if getattr(os, "geteuid", lambda: -1)() == 0:
+        return True
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("CapEff:"):
+                    return bool(int(line.split()[1], 16) & (1 << CAP_NET_ADMIN))
+    except (OSError, ValueError, IndexError):
+        pass
+    return False
+
 
 class NetworkManager:
     """Handles network configuration for robot communication."""
@@ -11,25 +49,119 @@ class NetworkManager:
     def __init__(self, config: Config, logger: logging.Logger):
         self.config = config
         self.logger = logger
+        self._iface_ips: Optional[Dict[str, Set[str]]] = None
+        self._iface_ips_loaded_at = 0.0
+        self._parsed_assignment: Optional[Tuple[str, str, int]] = None
     
-    def check_network_configured(self) -> bool:
-        """Check if the required network configuration exists."""
+    def invalidate_cache(self) -> None:
+        """Forget the cached interface table so the next check re-probes."""
+        self._iface_ips = None
+    
+    @staticmethod
+    def _run(cmd: List[str], timeout: float, need_stdout: bool = False,
+             need_stderr: bool = False) -> subprocess.CompletedProcess:
+        """Run a command, piping (fully buffered) only the streams that are read."""
+        return subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE if need_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE if need_stderr else subprocess.DEVNULL,
+            bufsize=-1,
+            text=True,
+            timeout=timeout
+        )
+    
+    def _load_iface_table(self) -> bool:
+        """Load all IPv4 addresses of every interface with a single `ip -j` call."""
         try:
-            result = subprocess.run(
-                ["ip", "addr", "show", self.config.network_interface],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+            result = self._run(IFACE_TABLE_CMD, timeout=5, need_stdout=True)
             
-            if result.returncode == 0:
-                return self.config.local_ip in result.stdout
-            return False
+            if result.returncode != 0:
+                self.logger.warning(f"Failed to list network interfaces (exit code {result.returncode})")
+                return False
+            
+            self._store_iface_table(result.stdout)
+            return True
             
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError) as e:
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, ValueError, KeyError) as e:
             self.logger.warning(f"Failed to check network configuration: {e}")
             return False
     
+    def _store_iface_table(self, stdout: str) -> None:
+        """Parse `ip -j addr show` output into the {ifname: {ips}} table."""
+        self._iface_ips = {
+            iface["ifname"]: {a["local"] for a in iface.get("addr_info", []) if "local" in a}
+            for iface in json.loads(stdout or "[]")
+            if "ifname" in iface  # Some iproute2 versions emit {} for interfaces without IPv4
+        }
+        self._iface_ips_loaded_at = time.monotonic()
+    
+    def _iface_table_stale(self) -> bool:
+        """Check whether the interface table must be (re)loaded."""
+        return self._iface_ips is None or time.monotonic() - self._iface_ips_loaded_at >= CONFIG_CACHE_TTL
+    
+    def _is_local_ip_assigned(self) -> bool:
+        """Look up the local IP in the loaded interface table."""
+        return self.config.local_ip in self._iface_ips.get(self.config.network_interface, set())
+    
+    def _record_local_ip(self) -> None:
+        """Record a freshly added address instead of re-probing right away."""
+        if self._iface_ips is not None:
+            self._iface_ips.setdefault(self.config.network_interface, set()).add(self.config.local_ip)
+    
+    def _addr_add_cmd(self) -> List[str]:
+        """Command that assigns the local IP to the robot interface."""
+        return [
+            "sudo", "ip", "addr", "add",
+            self.config.network_assignment,
+            "dev", self.config.network_interface
+        ]
+    
+    def _assignment(self) -> Tuple[str, int]:
+        """Local IP and prefix length parsed from Config.network_assignment (cached)."""
+        cidr = self.config.network_assignment
+        if self._parsed_assignment is None or self._parsed_assignment[0] != cidr:
+            iface = ipaddress.ip_interface(cidr)
+            self._parsed_assignment = (cidr, str(iface.ip), iface.network.prefixlen)
+        return self._parsed_assignment[1], self._parsed_assignment[2]
+    
+    def _add_address_netlink(self) -> bool:
+        """Add the local IP with one rtnetlink message; False if that is not possible here."""
+        if IPRoute is None or not has_cap_net_admin():
+            return False
+        
+        try:
+            address, prefixlen = self._assignment()
+            with IPRoute() as ipr:
+                links = ipr.link_lookup(ifname=self.config.network_interface)
+                if not links:
+                    self.logger.warning(f"⚠️ Interface {self.config.network_interface} not found via netlink")
+                    return False
+                ipr.addr("add", index=links[0], address=address, prefixlen=prefixlen)
+            return True
+        except NetlinkError as e:
+            if getattr(e, "code", None) == errno.EEXIST:
+                return True  # Address already assigned
+            self.logger.debug(f"Netlink address add failed, falling back to ip: {e}")
+            return False
+        except ValueError as e:
+            self.logger.warning(f"⚠️ Invalid network assignment {self.config.network_assignment}: {e}")
+            return False
+        except Exception as e:
+            # Socket setup or any other pyroute2 failure: let `sudo ip` handle it
+            self.logger.debug(f"Netlink unavailable, falling back to ip: {e}")
+            return False
+    
+    def _ping_cmd(self) -> List[str]:
+        """Single-packet liveness ping of the robot."""
+        return ["ping", "-c", "1", "-W", "1", self.config.robot_ip]
+    
+    def check_network_configured(self) -> bool:
+        """Check if the required network configuration exists."""
+        if self._iface_table_stale() and not self._load_iface_table():
+            return False
+        
+        return self._is_local_ip_assigned()
+    
     def configure_network(self) -> bool:
         """Configure network interface for robot communication."""
         if self.check_network_configured():
@@ -38,17 +170,17 @@ class NetworkManager:
         
         self.logger.info(f"🌐 Configuring network: {self.config.network_assignment} on {self.config.network_interface}")
         
+        if self._add_address_netlink():
+            self._record_local_ip()
+            self.logger.info("✅ Network configuration successful (netlink)")
+            return True
+        
         try:
             # Add IP address to interface
-            cmd = [
-                "sudo", "ip", "addr", "add",
-                self.config.network_assignment,
-                "dev", self.config.network_interface
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            result = self._run(self._addr_add_cmd(), timeout=10, need_stderr=True)
             
             if result.returncode == 0:
+                self._record_local_ip()
                 self.logger.info("✅ Network configuration successful")
                 return True
             else:
@@ -63,15 +195,29 @@ class NetworkManager:
             return False
     
     def test_robot_connectivity(self) -> bool:
-        """Test if robot is reachable."""
+        """Test if robot is reachable by connecting to its web interface port."""
         self.logger.info(f"🔍 Testing connectivity to {self.config.robot_ip}")
         
+        if self.config.ping_connectivity_check:
+            return self._ping_robot()
+        
+        try:
+            with socket.create_connection(
+                (self.config.robot_ip, self.config.robot_port),
+                timeout=CONNECT_PROBE_TIMEOUT
+            ):
+                pass
+            self.logger.info("✅ Robot is reachable")
+            return True
+        except OSError as e:
+            self.logger.warning(f"⚠️ Robot is not reachable on port {self.config.robot_port}: {e}")
+            return False
+    
+    def _ping_robot(self) -> bool:
+        """Test if robot answers ICMP ping."""
         try:
-            result = subprocess.run(
-                ["ping", "-c", "2", "-W", "3", self.config.robot_ip],
-                capture_output=True,
-                timeout=10
-            )
+            # Only the exit code matters
+            result = self._run(self._ping_cmd(), timeout=10)
             
             if result.returncode == 0:
                 self.logger.info("✅ Robot is reachable")
@@ -85,4 +231,13 @@ class NetworkManager:
             return False
         except Exception as e:
             self.logger.warning(f"⚠️ Connectivity test failed: {e}")
-            return False
\ No newline at end of file
+            return False
+    
+    def bootstrap(self) -> Tuple[bool, bool]:
+        """Configure the network, then probe the robot over it.
+        
+        Returns a (network_configured, robot_reachable) tuple.
+        """
+        configured = self.configure_network()
+        reachable = self.test_robot_connectivity()
+        return configured, reachable
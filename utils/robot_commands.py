@@ -1,16 +1,195 @@
 """Robot gripper control commands with real Selenium interactions."""
 
 import time
+import uuid
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import (
+    TimeoutException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from .robot_interface import FrankaRobotInterface
 
 
+Locator = Tuple[str, str]
+
+# Task library and sidebar
+_TASK_CONTAINER_LOCATORS: Tuple[Locator, ...] = (
+    (By.XPATH, "/html/body/div[2]/section/section/one-library/div/div[1]/div[2]"),
+    (By.CSS_SELECTOR, "one-library div[class*='div'][class*='div'] div[class*='div']"),
+)
+_EXEC_LOCATORS: Tuple[Locator, ...] = (
+    (By.CSS_SELECTOR, "body > div:nth-child(2) > section > one-sidebar > div.sidebar-body > div > div.fixed-sections > footer > section > div > div"),
+    (By.XPATH, "/html/body/div[2]/section/one-sidebar/div[1]/div/div[2]/footer/section/div/div"),
+    (By.CSS_SELECTOR, "one-sidebar footer section div div"),
+)
+_CONFIRM_LOCATORS: Tuple[Locator, ...] = (
+    (By.XPATH, "/html/body/div[3]/div[3]/div/div[2]/div[3]/div[2]/span/button"),
+    (By.XPATH, "//button[contains(., 'CONFIRM')]"),
+)
+
+# Programming timeline; the configuration dialog XPaths below are relative to it
+_TIMELINE_LOCATORS: Tuple[Locator, ...] = (
+    (By.TAG_NAME, "one-timeline"),
+    (By.XPATH, "/html/body/div[2]/section/section/section/one-timeline"),
+)
+_TASK_ICON_LOCATORS: Tuple[Locator, ...] = (
+    (By.CSS_SELECTOR, ".drag-area"),
+    (By.XPATH, "//div[@class='drag-area']"),
+    (By.XPATH, "//one-timeline-skill//div[contains(@class, 'drag-area')]"),
+    (By.XPATH, "//svg/use[@xlink:href*='gripper']/../.."),
+    (By.XPATH, "//svg/use[contains(@xlink:href, 'logo.svg')]/../.."),
+    (By.XPATH, "//use[@xlink:href='bundles/gripper_grasp/logo.svg#icon']/../.."),
+    (By.XPATH, "//use[@xlink:href*='gripper']/../.."),
+)
+
+_CONTEXT_MENU_XPATH = "./div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div"
+_CONTINUE_CONTAINER_XPATH = _CONTEXT_MENU_XPATH + "/div[4]/div[1]"
+_SPEED_XPATH = _CONTEXT_MENU_XPATH + "/div[3]/div[4]/div/step/linear-slider/step/div/div[4]/div[1]"
+_FORCE_XPATH = _CONTEXT_MENU_XPATH + "/div[3]/div[7]/div/step/linear-slider/step/div/div[4]"
+_LOAD_XPATH = _CONTEXT_MENU_XPATH + "/div[3]/div[10]/div/step/linear-slider/step/div/div[4]"
+_AXIS_TOGGLE_XPATH = _CONTEXT_MENU_XPATH + "/div[3]/div[1]/div/step/toggle-slider/step/div"
+_AXIS_BUTTON_XPATHS = {
+    "x": _AXIS_TOGGLE_XPATH + "/div[1]/button[1]",
+    "y": _AXIS_TOGGLE_XPATH + "/div[1]/button[2]",
+    "z": _AXIS_TOGGLE_XPATH + "/div[1]/button[3]",
+}
+_AXIS_VALUE_XPATH = _AXIS_TOGGLE_XPATH + "/div[2]/linear-slider/step/div/div[4]/div[1]"
+_ROBOT_SPEED_XPATH = _CONTEXT_MENU_XPATH + "/div[3]/div[7]/div/step/linear-slider/step/div/div[4]/div[1]"
+_ROBOT_ACCEL_XPATH = _CONTEXT_MENU_XPATH + "/div[3]/div[10]/div/step/linear-slider/step/div/div[4]/div[1]"
+
+# Adaptive polling for task completion (seconds)
+POLL_INTERVAL_MIN = 0.05
+POLL_INTERVAL_MAX = 1.0
+POLL_BACKOFF = 1.5
+
+# A Ready state observed this recently is trusted without re-checking (seconds)
+READY_STATE_TTL = 2.0
+
+# End-to-end time budget for a full gripper configuration sequence (seconds)
+CONFIGURE_BUDGET = 60.0
+
+# Reads Ready status and the execution button state in one WebDriver round trip
+_STATUS_PROBE_JS = """
+const ready = !!document.evaluate("//*[contains(text(), 'Ready')]", document, null,
+    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const btn = document.querySelector("body > div:nth-child(2) > section > one-sidebar > div.sidebar-body > div > div.fixed-sections > footer > section > div > div")
+    || document.querySelector("one-sidebar footer section div div");
+if (!btn) return [false, "", ""];  // Cannot tell whether a task is running
+return [ready, btn.getAttribute("class") || "", btn.innerText.toLowerCase()];
+"""
+
+# Returns the element's DOM id, assigning the given one if it has none
+_ENSURE_ID_JS = """
+if (!arguments[0].id) arguments[0].id = arguments[1];
+return arguments[0].id;
+"""
+
+# The element with the given DOM id if it is present and visible, else null.
+# Unlike find_element, a missing id does not pay the implicit wait.
+_VISIBLE_BY_ID_JS = """
+const el = document.getElementById(arguments[0]);
+return el && el.offsetParent !== null ? el : null;
+"""
+
+# Index of the first visible, enabled button under root whose text contains
+# "continue", or -1
+_FIND_CONTINUE_FN = """
+function findContinue(root) {
+    const buttons = root.querySelectorAll("button");
+    for (let i = 0; i < buttons.length; i++) {
+        const b = buttons[i];
+        if (b.innerText.trim().toLowerCase().includes("continue") && !b.disabled
+                && b.offsetParent !== null && getComputedStyle(b).visibility !== "hidden") {
+            return i;
+        }
+    }
+    return -1;
+}
+"""
+
+# Finds and clicks the Continue button under the given container in one round trip
+_CLICK_CONTINUE_JS = _FIND_CONTINUE_FN + """
+const index = findContinue(arguments[0]);
+if (index >= 0) arguments[0].querySelectorAll("button")[index].click();
+return index;
+"""
+
+# Writes a value into a slider's editable field and commits it with Enter.
+# The located node may be a wrapper, so the focused editable child is used.
+_SET_FIELD_FN = """
+function setField(el, value) {
+    el.click();
+    let target = el.contains(document.activeElement) ? document.activeElement
+        : el.querySelector("input, [contenteditable]:not([contenteditable='false'])") || el;
+    target.focus();
+    if ("value" in target) { target.value = value; } else { target.textContent = value; }
+    target.dispatchEvent(new Event("input", {bubbles: true}));
+    target.dispatchEvent(new Event("change", {bubbles: true}));
+    for (const type of ["keydown", "keyup"]) {
+        target.dispatchEvent(new KeyboardEvent(type, {key: "Enter", code: "Enter", keyCode: 13, bubbles: true}));
+    }
+}
+"""
+
+_SET_FIELD_JS = _SET_FIELD_FN + """
+setField(arguments[0], arguments[1]);
+"""
+
+# Walks the configuration dialog in one round trip: for every [xpath, value]
+# step, waits for the field to become visible, sets it, then clicks Continue.
+# A null xpath only clicks Continue. Waits are driven by DOM mutations under
+# the timeline rather than polling. Resolves null on success or a description
+# of the failed step.
+_CONFIGURE_DIALOG_JS = _SET_FIELD_FN + _FIND_CONTINUE_FN + """
+const [steps, containerXpath, timeout] = arguments;
+const cb = arguments[arguments.length - 1];
+const deadline = Date.now() + timeout;
+const find = (xpath) => {
+    const root = document.querySelector("one-timeline");
+    return root && document.evaluate(xpath, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+};
+const visible = (el) => el && el.offsetParent !== null ? el : null;
+const continueButton = () => {
+    const root = find(containerXpath);
+    const index = root ? findContinue(root) : -1;
+    return index >= 0 ? root.querySelectorAll("button")[index] : null;
+};
+const waitFor = (probe) => new Promise((resolve) => {
+    const hit = probe();
+    if (hit || Date.now() > deadline) { resolve(hit); return; }
+    let timer = null;
+    const obs = new MutationObserver(() => {
+        const found = probe();
+        if (found) { obs.disconnect(); clearTimeout(timer); resolve(found); }
+    });
+    obs.observe(document.querySelector("one-timeline") || document.body,
+        {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setTimeout(() => { obs.disconnect(); resolve(probe()); }, deadline - Date.now());
+});
+(async () => {
+    for (const [xpath, value] of steps) {
+        if (xpath) {
+            const field = await waitFor(() => visible(find(xpath)));
+            if (!field) return "field not found: " + xpath;
+            setField(field, value);
+        }
+        const button = await waitFor(continueButton);
+        if (!button) return "Continue button not found";
+        button.click();
+        await new Promise(requestAnimationFrame);
+    }
+    return null;
+})().then(cb, (e) => cb(String(e)));
+"""
+
+
 class FrankaRobotCommands:
     """Robot gripper control commands with real Selenium automation."""
     
@@ -19,39 +198,80 @@ class FrankaRobotCommands:
         self.logger = logger
         self.selenium = robot_interface.selenium
         self.driver = robot_interface.driver
+        self._elt_cache: Dict[str, WebElement] = {}
+        self._last_ready_at = 0.0
+        self._task_id_cache: Dict[str, str] = {}
     
-    def wait_for_element(self, locator, timeout=10):
-        """Wait for element to be present and return it."""
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
-            )
-            return element
-        except:
-            return None
+    def _get_cached(self, key: str, locators: Sequence[Locator], timeout: float) -> Optional[WebElement]:
+        """Return the cached element for key, re-resolving it if missing or stale."""
+        element = self._elt_cache.get(key)
+        if element is not None:
+            try:
+                element.is_enabled()
+                return element
+            except StaleElementReferenceException:
+                del self._elt_cache[key]
+        
+        element = self.selenium.try_multiple_locators(locators, timeout=timeout)
+        if element is not None:
+            self._elt_cache[key] = element
+        return element
+    
+    def clear_element_cache(self) -> None:
+        """Drop all cached elements and task ids, e.g. after the page was reloaded."""
+        self._elt_cache.clear()
+        self._task_id_cache.clear()
+    
+    def wait_for_timeline_element(self, xpath: str, *, timeout: float) -> Optional[WebElement]:
+        """Wait for an element addressed relative to the cached <one-timeline> root."""
+        deadline = time.monotonic() + timeout
+        while True:
+            # Staleness shows up in the lookup below, so skip _get_cached's extra probe
+            root = self._elt_cache.get("timeline")
+            if root is None:
+                root = self._get_cached("timeline", _TIMELINE_LOCATORS, timeout=max(deadline - time.monotonic(), 0.1))
+                if root is None:
+                    return None
+            try:
+                return WebDriverWait(root, max(deadline - time.monotonic(), 0)).until(
+                    lambda r: r.find_element(By.XPATH, xpath)
+                )
+            except StaleElementReferenceException:
+                # Timeline was re-rendered; resolve the root again
+                self._elt_cache.pop("timeline", None)
+                if time.monotonic() >= deadline:
+                    return None
+            except TimeoutException:
+                return None
 
-    def wait_for_clickable_element(self, locator, timeout=10):
-        """Wait for element to be clickable and return it."""
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            return element
-        except:
-            return None
+    @staticmethod
+    def _time_left(deadline: float) -> float:
+        """Seconds remaining until deadline; raise TimeoutError once the budget is spent."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("time budget exhausted")
+        return remaining
 
     # ========== TASK SELECTION ==========
     
-    def select_task_from_list(self, task_name: str) -> bool:
+    def select_task_from_list(self, task_name: str, *, timeout: float) -> bool:
         """Select a task from the task list by name."""
         self.logger.info(f"🎯 Selecting task: {task_name}")
         
-        task_container_locators = [
-            (By.XPATH, "/html/body/div[2]/section/section/one-library/div/div[1]/div[2]"),
-            (By.CSS_SELECTOR, "one-library div[class*='div'][class*='div'] div[class*='div']"),
-        ]
+        # Fast path: jump straight to the element resolved on a previous call
+        task_id = self._task_id_cache.get(task_name)
+        if task_id:
+            try:
+                cached_element = self.driver.execute_script(_VISIBLE_BY_ID_JS, task_id)
+                # Single attempt: on any trouble fall back to the list scan right away
+                if cached_element and self.selenium.click_element_robust(cached_element, max_attempts=1):
+                    self._task_selected(task_name)
+                    return True
+            except WebDriverException as e:
+                self.logger.debug(f"Cached task id {task_id} not usable: {e}")
+            self._task_id_cache.pop(task_name, None)
         
-        task_container = self.selenium.try_multiple_locators(task_container_locators, timeout=5)
+        task_container = self.selenium.try_multiple_locators(_TASK_CONTAINER_LOCATORS, timeout=timeout)
         if not task_container:
             self.logger.error("❌ Could not find task container")
             return False
@@ -65,8 +285,9 @@ class FrankaRobotCommands:
             try:
                 task_element = task_container.find_element(*locator)
                 if task_element:
+                    self._remember_task_id(task_name, task_element)
                     self.selenium.click_element_robust(task_element)
-                    self.logger.info(f"✅ Selected task: {task_name}")
+                    self._task_selected(task_name)
                     return True
             except:
                 continue
@@ -74,19 +295,29 @@ class FrankaRobotCommands:
         self.logger.error(f"❌ Could not find task: {task_name}")
         return False
     
+    def _remember_task_id(self, task_name: str, task_element: WebElement) -> None:
+        """Cache a DOM id for the task entry before clicking re-renders anything."""
+        try:
+            self._task_id_cache[task_name] = self.driver.execute_script(
+                _ENSURE_ID_JS, task_element, f"auto_task_{uuid.uuid4().hex}"
+            )
+        except WebDriverException as e:
+            # Only the fast path is lost; the selection itself goes ahead
+            self.logger.debug(f"Could not cache DOM id for {task_name}: {e}")
+    
+    def _task_selected(self, task_name: str) -> None:
+        """Bookkeeping after a task was clicked in the library."""
+        # The timeline is rebuilt for the selected task
+        self._elt_cache.pop("task_icon", None)
+        self.logger.info(f"✅ Selected task: {task_name}")
+    
     # ========== TASK EXECUTION ==========
     
     def click_execution_button(self) -> bool:
         """Click the execution (play) button in the sidebar."""
         self.logger.info("▶️ Clicking execution button...")
         
-        execution_locators = [
-            (By.CSS_SELECTOR, "body > div:nth-child(2) > section > one-sidebar > div.sidebar-body > div > div.fixed-sections > footer > section > div > div"),
-            (By.XPATH, "/html/body/div[2]/section/one-sidebar/div[1]/div/div[2]/footer/section/div/div"),
-            (By.CSS_SELECTOR, "one-sidebar footer section div div"),
-        ]
-        
-        execution_button = self.selenium.try_multiple_locators(execution_locators, timeout=5)
+        execution_button = self._get_cached("exec_btn", _EXEC_LOCATORS, timeout=5)
         if execution_button:
             self.selenium.click_element_robust(execution_button)
             self.logger.info("✅ Execution button clicked")
@@ -99,12 +330,7 @@ class FrankaRobotCommands:
         """Click the CONFIRM button in the task execution dialog."""
         self.logger.info("✅ Clicking CONFIRM button...")
         
-        confirm_locators = [
-            (By.XPATH, "/html/body/div[3]/div[3]/div/div[2]/div[3]/div[2]/span/button"),
-            (By.XPATH, "//button[contains(., 'CONFIRM')]"),
-        ]
-        
-        confirm_button = self.selenium.try_multiple_locators(confirm_locators, timeout=10)
+        confirm_button = self.selenium.try_multiple_locators(_CONFIRM_LOCATORS, timeout=10)
         if confirm_button:
             self.selenium.click_element_robust(confirm_button)
             self.logger.info("✅ Task execution confirmed")
@@ -113,38 +339,25 @@ class FrankaRobotCommands:
             self.logger.error("❌ Could not find CONFIRM button")
             return False
 
-    def wait_for_ready(self) -> bool:
+    def wait_for_ready(self, timeout: float = 30) -> bool:
         """Wait for robot to return to Ready status."""
         self.logger.info("⏳ Waiting for task completion...")
         
-        try:
-            ready_element = WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Ready')]"))
-            )
-            if ready_element:
-                self.logger.info("🎉 Task completed - Robot is Ready!")
-                return True
-        except TimeoutException:
-            self.logger.error("❌ Task timeout")
-            return False
+        if self.robot.wait_for_ready_text(timeout):
+            self._last_ready_at = time.monotonic()
+            self.logger.info("🎉 Task completed - Robot is Ready!")
+            return True
+        
+        self.logger.error("❌ Task timeout")
+        return False
 
     # ========== TASK CONFIGURATION ==========
     
-    def click_task_icon_for_config(self) -> bool:
+    def click_task_icon_for_config(self, *, timeout: float) -> bool:
         """Click on the task icon in the programming window to open configuration."""
         self.logger.info("🔧 Clicking task icon to open configuration...")
         
-        icon_locators = [
-            (By.CSS_SELECTOR, ".drag-area"),
-            (By.XPATH, "//div[@class='drag-area']"),
-            (By.XPATH, "//one-timeline-skill//div[contains(@class, 'drag-area')]"),
-            (By.XPATH, "//svg/use[@xlink:href*='gripper']/../.."),
-            (By.XPATH, "//svg/use[contains(@xlink:href, 'logo.svg')]/../.."),
-            (By.XPATH, "//use[@xlink:href='bundles/gripper_grasp/logo.svg#icon']/../.."),
-            (By.XPATH, "//use[@xlink:href*='gripper']/../.."),
-        ]
-        
-        icon_element = self.selenium.try_multiple_locators(icon_locators, timeout=5)
+        icon_element = self._get_cached("task_icon", _TASK_ICON_LOCATORS, timeout=timeout)
         if icon_element:
             self.selenium.click_element_robust(icon_element)
             self.logger.info("✅ Clicked task icon - configuration dialog should open")
@@ -153,55 +366,24 @@ class FrankaRobotCommands:
             self.logger.error("❌ Could not find task icon for configuration")
             return False
 
-    def click_continue_button(self) -> bool:
+    def click_continue_button(self, *, timeout: float) -> bool:
         """Click the Continue button - WORKING VERSION, NO SLEEPS."""
         self.logger.info("➡️ Looking for Continue button...")
         
         try:
             # Wait for the button container to appear
-            container_xpath = "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[4]/div[1]"
-            
-            container = self.wait_for_element((By.XPATH, container_xpath), timeout=10)
+            container = self.wait_for_timeline_element(_CONTINUE_CONTAINER_XPATH, timeout=timeout)
             if not container:
                 self.logger.error("❌ Could not find button container")
                 return False
             
             self.logger.info("✅ Found button container")
             
-            # Find all buttons in this container
-            buttons = container.find_elements(By.TAG_NAME, "button")
-            self.logger.info(f"Found {len(buttons)} buttons in container")
-            
-            # Look for the Continue button specifically
-            for i, button in enumerate(buttons):
-                try:
-                    button_text = button.text.strip().lower()
-                    self.logger.info(f"Button {i+1}: '{button_text}' - Visible: {button.is_displayed()}, Enabled: {button.is_enabled()}")
-                    
-                    if "continue" in button_text:
-                        self.logger.info(f"Found Continue button: '{button.text}'")
-                        
-                        if button.is_displayed() and button.is_enabled():
-                            # Try direct click first
-                            try:
-                                button.click()
-                                self.logger.info("✅ Clicked Continue button (direct click)")
-                                return True
-                            except Exception as e1:
-                                self.logger.warning(f"Direct click failed: {e1}")
-                                # Try JavaScript click
-                                try:
-                                    self.driver.execute_script("arguments[0].click();", button)
-                                    self.logger.info("✅ Clicked Continue button (JavaScript click)")
-                                    return True
-                                except Exception as e2:
-                                    self.logger.error(f"JavaScript click failed: {e2}")
-                        else:
-                            self.logger.warning(f"Continue button not clickable - Displayed: {button.is_displayed()}, Enabled: {button.is_enabled()}")
-                
-                except Exception as e:
-                    self.logger.warning(f"Error checking button {i+1}: {e}")
-                    continue
+            # Locate the first visible, enabled Continue button and click it in one round trip
+            index = self.driver.execute_script(_CLICK_CONTINUE_JS, container)
+            if index >= 0:
+                self.logger.info(f"✅ Clicked Continue button (button {index + 1})")
+                return True
             
             self.logger.error("❌ No Continue button found in container")
             return False
@@ -210,7 +392,11 @@ class FrankaRobotCommands:
             self.logger.error(f"❌ Error clicking Continue button: {e}")
             return False
 
-    def set_speed_value(self, speed: int) -> bool:
+    def _set_field_js(self, element: WebElement, value) -> None:
+        """Set an editable slider field and press Enter in a single script call."""
+        self.driver.execute_script(_SET_FIELD_JS, element, str(value))
+
+    def set_speed_value(self, speed: int, *, timeout: float) -> bool:
         """Set speed value using the correct editable div path."""
         self.logger.info(f"⚡ Setting speed to: {speed}")
         
@@ -219,149 +405,56 @@ class FrankaRobotCommands:
             return False
         
         try:
-            # Use the correct path with /div[1] at the end for the editable element
-            speed_input_xpath = "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[4]/div/step/linear-slider/step/div/div[4]/div[1]"
-            
             self.logger.info("⏳ Waiting for speed editable field to appear...")
-            speed_element = self.wait_for_element((By.XPATH, speed_input_xpath), timeout=15)
-            
+            speed_element = self.wait_for_timeline_element(_SPEED_XPATH, timeout=timeout)
             if not speed_element:
                 self.logger.error("❌ Speed editable field not found")
                 return False
             
-            self.logger.info("✅ Found speed editable field")
-            
-            try:
-                # Click to make it editable
-                speed_element.click()
-                self.logger.info("Clicked to make field editable")
-                
-                # Now just use simple key commands since cursor is in the field
-                from selenium.webdriver.common.action_chains import ActionChains
-                actions = ActionChains(self.driver)
-                
-                # Select all existing text and replace with new value
-                actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL)  # Ctrl+A to select all
-                actions.send_keys(str(speed))  # Type new value
-                actions.send_keys(Keys.ENTER)  # Press Enter
-                actions.perform()
-                
-                self.logger.info(f"✅ Speed set to {speed} with simple key commands")
-                return True
-                
-            except Exception as e:
-                self.logger.error(f"Failed to set speed: {e}")
-                return False
-            
-        except Exception as e:
-            self.logger.error(f"❌ Failed to set speed: {e}")
-            return False
-
-    def set_force_value(self, force: int) -> bool:
-        """Set grasping force value using the correct path."""
-        self.logger.info(f"💪 Setting grasping force to: {force}")
-        
-        try:
-            # Use the correct path for force field
-            force_input_xpath = "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[7]/div/step/linear-slider/step/div/div[4]"
-            
-            self.logger.info("⏳ Waiting for force input field to appear...")
-            force_element = self.wait_for_element((By.XPATH, force_input_xpath), timeout=15)
-            
-            if not force_element:
-                self.logger.error("❌ Force input field not found")
-                return False
-            
-            self.logger.info("✅ Found force input field")
+            self._set_field_js(speed_element, speed)
             
-            # Click to make it editable
-            force_element.click()
-            self.logger.info("Clicked to make force field editable")
-            
-            # Use same key commands as speed
-            from selenium.webdriver.common.action_chains import ActionChains
-            actions = ActionChains(self.driver)
-            
-            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL)  # Ctrl+A
-            actions.send_keys(str(force))  # Type new value
-            actions.send_keys(Keys.ENTER)  # Press Enter
-            actions.perform()
-            
-            self.logger.info(f"✅ Grasping force set to {force}")
+            self.logger.info(f"✅ Speed set to {speed}")
             return True
             
         except Exception as e:
-            self.logger.error(f"❌ Failed to set grasping force: {e}")
+            self.logger.error(f"❌ Failed to set speed: {e}")
             return False
 
-    def set_load_value(self, load: int) -> bool:
-        """Set load value using the correct path."""
-        self.logger.info(f"⚖️ Setting load to: {load}")
-        
+    def _probe_status(self) -> Tuple[bool, str, str]:
+        """Return (ready, execution_button_class, execution_button_text) in one round trip."""
         try:
-            # Use the correct path for load field
-            load_input_xpath = "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[10]/div/step/linear-slider/step/div/div[4]"
-            
-            self.logger.info("⏳ Waiting for load input field to appear...")
-            load_element = self.wait_for_element((By.XPATH, load_input_xpath), timeout=15)
-            
-            if not load_element:
-                self.logger.error("❌ Load input field not found")
-                return False
-            
-            self.logger.info("✅ Found load input field")
-            
-            # Click to make it editable
-            load_element.click()
-            self.logger.info("Clicked to make load field editable")
-            
-            # Use same key commands as speed and force
-            from selenium.webdriver.common.action_chains import ActionChains
-            actions = ActionChains(self.driver)
-            
-            actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL)  # Ctrl+A
-            actions.send_keys(str(load))  # Type new value
-            actions.send_keys(Keys.ENTER)  # Press Enter
-            actions.perform()
-            
-            self.logger.info(f"✅ Load set to {load}")
-            return True
-            
+            ready, button_classes, button_text = self.driver.execute_script(_STATUS_PROBE_JS)
+            return bool(ready), button_classes or "", button_text or ""
         except Exception as e:
-            self.logger.error(f"❌ Failed to set load: {e}")
-            return False
+            self.logger.debug(f"Status probe failed: {e}")
+            return False, "", ""
 
     def wait_for_task_completion(self, timeout=30) -> bool:
         """Wait for current task to complete and robot to be truly ready."""
         self.logger.info("⏳ Waiting for current task to complete...")
         
         try:
-            # Wait for robot status to show Ready and no task is running
-            for i in range(timeout * 2):  # Check every 0.5 seconds
-                try:
-                    # Check if robot shows Ready status
-                    ready_element = self.driver.find_element(By.XPATH, "//*[contains(text(), 'Ready')]")
-                    
-                    # Check if execution button shows "run" (not "stop")
-                    execution_button = self.selenium.try_multiple_locators([
-                        (By.CSS_SELECTOR, "body > div:nth-child(2) > section > one-sidebar > div.sidebar-body > div > div.fixed-sections > footer > section > div > div"),
-                        (By.XPATH, "/html/body/div[2]/section/one-sidebar/div[1]/div/div[2]/footer/section/div/div"),
-                    ], timeout=0.5)
-                    
-                    if execution_button:
-                        # Check button state - if it shows play icon or "run", task is done
-                        button_classes = execution_button.get_attribute("class") or ""
-                        button_text = execution_button.text.lower()
-                        
-                        # If button doesn't contain "stop" indicators, task is complete
-                        if "stop" not in button_classes and "stop" not in button_text:
-                            self.logger.info("✅ Task completed - Robot is ready for next task")
-                            return True
-                    
-                except:
-                    pass
+            # Wait for robot status to show Ready and no task is running.
+            # Probe immediately, then back off while nothing changes.
+            deadline = time.monotonic() + timeout
+            interval = POLL_INTERVAL_MIN
+            last_state = None
+            while time.monotonic() < deadline:
+                state = self._probe_status()
+                ready, button_classes, button_text = state
+                
+                # If button doesn't contain "stop" indicators, task is complete
+                if ready and "stop" not in button_classes and "stop" not in button_text:
+                    self._last_ready_at = time.monotonic()
+                    self.logger.info("✅ Task completed - Robot is ready for next task")
+                    return True
+                
+                if state != last_state:
+                    interval = POLL_INTERVAL_MIN
+                    last_state = state
                 
-                time.sleep(0.5)
+                time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+                interval = min(interval * POLL_BACKOFF, POLL_INTERVAL_MAX)
             
             self.logger.error(f"❌ Task did not complete within {timeout} seconds")
             return False
@@ -370,23 +463,23 @@ class FrankaRobotCommands:
             self.logger.error(f"❌ Error waiting for task completion: {e}")
             return False
 
-    def set_axis_offset(self, axis: str, value: float) -> bool:
+    def wait_until_idle(self, *, timeout: float) -> None:
+        """Make sure no task is running, skipping the check right after a known Ready state."""
+        if time.monotonic() - self._last_ready_at <= READY_STATE_TTL:
+            return
+        
+        if not self.wait_for_task_completion(timeout=timeout):
+            self.logger.warning("⚠️ Previous task still running, waiting...")
+
+    def set_axis_offset(self, axis: str, value: float, *, timeout: float) -> bool:
         """Set offset value for X, Y, or Z axis."""
         self.logger.info(f"📐 Setting {axis.upper()} offset to {value}")
         
+        deadline = time.monotonic() + timeout
         try:
-            # Button paths for X, Y, Z
-            button_paths = {
-                "x": "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[1]/div/step/toggle-slider/step/div/div[1]/button[1]",
-                "y": "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[1]/div/step/toggle-slider/step/div/div[1]/button[2]",
-                "z": "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[1]/div/step/toggle-slider/step/div/div[1]/button[3]"
-            }
-            
-            # Shared text field path
-            text_field_path = "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[1]/div/step/toggle-slider/step/div/div[2]/linear-slider/step/div/div[4]/div[1]"
-            
             # 1. Click the axis button (X, Y, or Z)
-            axis_button = self.wait_for_element((By.XPATH, button_paths[axis.lower()]), timeout=10)
+            axis_button = self.wait_for_timeline_element(_AXIS_BUTTON_XPATHS[axis.lower()],
+                                                         timeout=self._time_left(deadline))
             if not axis_button:
                 self.logger.error(f"❌ {axis.upper()} button not found")
                 return False
@@ -395,7 +488,7 @@ class FrankaRobotCommands:
             self.logger.info(f"✅ Clicked {axis.upper()} button")
             
             # 2. Set value in the shared text field
-            text_field = self.wait_for_element((By.XPATH, text_field_path), timeout=10)
+            text_field = self.wait_for_timeline_element(_AXIS_VALUE_XPATH, timeout=self._time_left(deadline))
             if not text_field:
                 self.logger.error(f"❌ Text field not found for {axis.upper()}")
                 return False
@@ -403,7 +496,6 @@ class FrankaRobotCommands:
             # Click to make editable and set value
             text_field.click()
             
-            from selenium.webdriver.common.action_chains import ActionChains
             actions = ActionChains(self.driver)
             
             actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL)  # Ctrl+A
@@ -418,21 +510,18 @@ class FrankaRobotCommands:
             self.logger.error(f"❌ Failed to set {axis.upper()} offset: {e}")
             return False
 
-    def set_robot_speed(self, speed: int) -> bool:
+    def set_robot_speed(self, speed: int, *, timeout: float) -> bool:
         """Set robot movement speed."""
         self.logger.info(f"⚡ Setting robot speed to {speed}%")
         
         try:
-            speed_field_path = "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[7]/div/step/linear-slider/step/div/div[4]/div[1]"
-            
-            speed_field = self.wait_for_element((By.XPATH, speed_field_path), timeout=10)
+            speed_field = self.wait_for_timeline_element(_ROBOT_SPEED_XPATH, timeout=timeout)
             if not speed_field:
                 self.logger.error("❌ Robot speed field not found")
                 return False
             
             speed_field.click()
             
-            from selenium.webdriver.common.action_chains import ActionChains
             actions = ActionChains(self.driver)
             
             actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL)
@@ -447,21 +536,18 @@ class FrankaRobotCommands:
             self.logger.error(f"❌ Failed to set robot speed: {e}")
             return False
 
-    def set_robot_acceleration(self, acceleration: int) -> bool:
+    def set_robot_acceleration(self, acceleration: int, *, timeout: float) -> bool:
         """Set robot acceleration."""
         self.logger.info(f"🚀 Setting robot acceleration to {acceleration}%")
         
         try:
-            accel_field_path = "/html/body/div[2]/section/section/section/one-timeline/div[3]/div/one-container/div/one-timeline-skill/div/one-context-menu/div/div[3]/div[10]/div/step/linear-slider/step/div/div[4]/div[1]"
-            
-            accel_field = self.wait_for_element((By.XPATH, accel_field_path), timeout=10)
+            accel_field = self.wait_for_timeline_element(_ROBOT_ACCEL_XPATH, timeout=timeout)
             if not accel_field:
                 self.logger.error("❌ Robot acceleration field not found")
                 return False
             
             accel_field.click()
             
-            from selenium.webdriver.common.action_chains import ActionChains
             actions = ActionChains(self.driver)
             
             actions.key_down(Keys.CONTROL).send_keys('a').key_up(Keys.CONTROL)
@@ -479,35 +565,38 @@ class FrankaRobotCommands:
 
     # ========== HIGH-LEVEL GRIPPER COMMANDS ==========
 
-    def configure_gripper_open(self, speed: int = 20) -> bool:
-        """Configure Gripper_open task with specified speed - NO SLEEPS."""
+    def configure_gripper_open(self, speed: int = 20, total_budget: float = CONFIGURE_BUDGET) -> bool:
+        """Configure Gripper_open task with specified speed - NO SLEEPS.
+        
+        All steps share total_budget seconds instead of each using its own timeout.
+        """
         self.logger.info(f"⚙️ Configuring Gripper_open with speed={speed}")
+        deadline = time.monotonic() + total_budget
         
         try:
             # 0. Wait for any current task to complete first
-            if not self.wait_for_task_completion(timeout=10):
-                self.logger.warning("⚠️ Previous task still running, waiting...")
+            self.wait_until_idle(timeout=min(10, self._time_left(deadline)))
             
             # 1. Select Gripper_open task
-            if not self.select_task_from_list("Gripper_open"):
+            if not self.select_task_from_list("Gripper_open", timeout=self._time_left(deadline)):
                 return False
             
             # 2. Click task icon to configure
-            if not self.click_task_icon_for_config():
+            if not self.click_task_icon_for_config(timeout=self._time_left(deadline)):
                 return False
             
             # 3. Click Continue button (width -> speed tab)
-            if not self.click_continue_button():
+            if not self.click_continue_button(timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to click Continue button")
                 return False
             
             # 4. Set speed value
-            if not self.set_speed_value(speed):
+            if not self.set_speed_value(speed, timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to set speed value")
                 return False
             
             # 5. Click Continue button again (close dialog)
-            if not self.click_continue_button():
+            if not self.click_continue_button(timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to click Continue button to close")
                 return False
             
@@ -518,8 +607,12 @@ class FrankaRobotCommands:
             self.logger.error(f"❌ Failed to configure gripper open: {e}")
             return False
 
-    def configure_gripper_close(self, speed: int = 50, force: int = 80, load: int = 400) -> bool:
-        """Configure Gripper_close task with speed, force, and load parameters."""
+    def configure_gripper_close(self, speed: int = 50, force: int = 80, load: int = 400,
+                                total_budget: float = CONFIGURE_BUDGET) -> bool:
+        """Configure Gripper_close task with speed, force, and load parameters.
+        
+        All steps share total_budget seconds instead of each using its own timeout.
+        """
         self.logger.info(f"⚙️ Configuring Gripper_close with speed={speed}, force={force}, load={load}")
         
         # Validate parameters
@@ -533,53 +626,21 @@ class FrankaRobotCommands:
             self.logger.error(f"❌ Load {load} out of range (10-1000)")
             return False
         
+        deadline = time.monotonic() + total_budget
         try:
             # 0. Wait for any current task to complete first
-            if not self.wait_for_task_completion(timeout=10):
-                self.logger.warning("⚠️ Previous task still running, waiting...")
+            self.wait_until_idle(timeout=min(10, self._time_left(deadline)))
             
             # 1. Select Gripper_close task
-            if not self.select_task_from_list("Gripper_close"):
+            if not self.select_task_from_list("Gripper_close", timeout=self._time_left(deadline)):
                 return False
             
             # 2. Click task icon to configure
-            if not self.click_task_icon_for_config():
-                return False
-            
-            # 3. Skip Gripper width tab -> Continue
-            self.logger.info("📏 Skipping gripper width configuration...")
-            if not self.click_continue_button():
-                self.logger.error("❌ Failed to skip gripper width")
+            if not self.click_task_icon_for_config(timeout=self._time_left(deadline)):
                 return False
             
-            # 4. Configure Gripper speed -> Continue
-            self.logger.info(f"⚡ Setting gripper speed to {speed}...")
-            if not self.set_speed_value(speed):
-                self.logger.error("❌ Failed to set gripper speed")
-                return False
-            
-            if not self.click_continue_button():
-                self.logger.error("❌ Failed to continue from speed tab")
-                return False
-            
-            # 5. Configure Grasping force -> Continue
-            self.logger.info(f"💪 Setting grasping force to {force}...")
-            if not self.set_force_value(force):
-                self.logger.error("❌ Failed to set grasping force")
-                return False
-            
-            if not self.click_continue_button():
-                self.logger.error("❌ Failed to continue from force tab")
-                return False
-            
-            # 6. Configure Load -> Continue (to close)
-            self.logger.info(f"⚖️ Setting load to {load}...")
-            if not self.set_load_value(load):
-                self.logger.error("❌ Failed to set load")
-                return False
-            
-            if not self.click_continue_button():
-                self.logger.error("❌ Failed to close dialog from load tab")
+            # 3. Skip width, set speed, force and load, closing with Continue
+            if not self._apply_gripper_close_config_js(speed, force, load, timeout=self._time_left(deadline)):
                 return False
             
             self.logger.info(f"✅ Gripper_close configured (speed={speed}, force={force}, load={load})")
@@ -589,12 +650,32 @@ class FrankaRobotCommands:
             self.logger.error(f"❌ Failed to configure gripper close: {e}")
             return False
 
+    def _run_config_dialog(self, steps: List[Tuple[Optional[str], str]], timeout: float) -> bool:
+        """Fill and advance the open configuration dialog with one async script."""
+        error = self.selenium.execute_async_script_timed(
+            _CONFIGURE_DIALOG_JS, steps, _CONTINUE_CONTAINER_XPATH, timeout * 1000,
+            timeout=timeout + 1
+        )
+        if error:
+            self.logger.error(f"❌ Configuration dialog failed: {error}")
+            return False
+        return True
+
+    def _apply_gripper_close_config_js(self, speed: int, force: int, load: int, timeout: float) -> bool:
+        """Walk the open Gripper_close dialog (width -> speed -> force -> load) in one call."""
+        self.logger.info(f"📝 Applying Gripper_close dialog: speed={speed}, force={force}, load={load}")
+        return self._run_config_dialog([
+            (None, ""),  # Gripper width is left unchanged
+            (_SPEED_XPATH, str(speed)),
+            (_FORCE_XPATH, str(force)),
+            (_LOAD_XPATH, str(load)),
+        ], timeout)
 
     def gripper_open(self) -> bool:
         """Execute gripper open command."""
         self.logger.info("🔓 Opening gripper...")
         
-        if not self.select_task_from_list("Gripper_open"):
+        if not self.select_task_from_list("Gripper_open", timeout=5):
             return False
         
         if not self.click_execution_button():
@@ -615,10 +696,9 @@ class FrankaRobotCommands:
         self.logger.info("🤏 Closing gripper...")
         
         # First, make sure no task is currently running
-        if not self.wait_for_task_completion(timeout=10):
-            self.logger.warning("⚠️ Previous task still running, waiting...")
+        self.wait_until_idle(timeout=10)
         
-        if not self.select_task_from_list("Gripper_close"):
+        if not self.select_task_from_list("Gripper_close", timeout=5):
             return False
         
         if not self.click_execution_button():
@@ -634,8 +714,12 @@ class FrankaRobotCommands:
         self.logger.info("✅ Gripper closed successfully")
         return True
 
-    def move_robot(self, x: float = 0, y: float = 0, z: float = 0, speed: int = 5, acceleration: int = 5) -> bool:
-        """Move robot with relative motion and execute immediately."""
+    def move_robot(self, x: float = 0, y: float = 0, z: float = 0, speed: int = 5, acceleration: int = 5,
+                   total_budget: float = CONFIGURE_BUDGET) -> bool:
+        """Move robot with relative motion and execute immediately.
+        
+        All configuration steps share total_budget seconds instead of each using its own timeout.
+        """
         self.logger.info(f"🤖 Moving robot: X={x}, Y={y}, Z={z}, Speed={speed}%, Accel={acceleration}%")
         
         # Validate parameters
@@ -646,60 +730,60 @@ class FrankaRobotCommands:
             self.logger.error(f"❌ Acceleration {acceleration} out of range (5-100%)")
             return False
         
+        deadline = time.monotonic() + total_budget
         try:
             # 0. Wait for any current task to complete
-            if not self.wait_for_task_completion(timeout=10):
-                self.logger.warning("⚠️ Previous task still running, waiting...")
+            self.wait_until_idle(timeout=min(10, self._time_left(deadline)))
             
             # 1. Select Move_robot task
-            if not self.select_task_from_list("Move_robot"):
+            if not self.select_task_from_list("Move_robot", timeout=self._time_left(deadline)):
                 return False
             
             # 2. Click task icon to configure
-            if not self.click_task_icon_for_config():
+            if not self.click_task_icon_for_config(timeout=self._time_left(deadline)):
                 return False
             
             # 3. Set ALL X, Y, Z offsets explicitly (including 0 values to clear previous configs)
-            if not self.set_axis_offset("x", x):
+            if not self.set_axis_offset("x", x, timeout=self._time_left(deadline)):
                 return False
             
-            if not self.set_axis_offset("y", y):
+            if not self.set_axis_offset("y", y, timeout=self._time_left(deadline)):
                 return False
             
-            if not self.set_axis_offset("z", z):
+            if not self.set_axis_offset("z", z, timeout=self._time_left(deadline)):
                 return False
             
             # 4. Continue from OFFSET to FRAME tab
             self.logger.info("📐 Continuing from OFFSET to FRAME...")
-            if not self.click_continue_button():
+            if not self.click_continue_button(timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to continue from OFFSET to FRAME")
                 return False
             
             # 5. Continue from FRAME to SPEED tab (skip frame selection)
             self.logger.info("🖼️ Continuing from FRAME to SPEED...")
-            if not self.click_continue_button():
+            if not self.click_continue_button(timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to continue from FRAME to SPEED")
                 return False
             
             # 6. Set speed in SPEED tab
             self.logger.info(f"⚡ Setting robot speed to {speed}%...")
-            if not self.set_robot_speed(speed):
+            if not self.set_robot_speed(speed, timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to set robot speed")
                 return False
             
             # 7. Continue from SPEED to ACCELERATION tab
-            if not self.click_continue_button():
+            if not self.click_continue_button(timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to continue from SPEED to ACCELERATION")
                 return False
             
             # 8. Set acceleration in ACCELERATION tab
             self.logger.info(f"🚀 Setting robot acceleration to {acceleration}%...")
-            if not self.set_robot_acceleration(acceleration):
+            if not self.set_robot_acceleration(acceleration, timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to set robot acceleration")
                 return False
             
             # 9. Continue to close dialog
-            if not self.click_continue_button():
+            if not self.click_continue_button(timeout=self._time_left(deadline)):
                 self.logger.error("❌ Failed to close configuration dialog")
                 return False
             
@@ -4,11 +4,33 @@ import time
 import logging
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from .config import Config
 from .selenium_helper import SeleniumHelper
 from .locators import FrankaLocators
 
 
+# Resolves as soon as a 'Ready'/'READY' text node appears anywhere in the page,
+# driven by DOM mutations instead of fixed-interval polling
+_WAIT_FOR_READY_JS = """
+const root = document.body;
+const timeout = arguments[0];
+const cb = arguments[arguments.length - 1];
+let timer = null;
+const obs = new MutationObserver(() => check());
+const check = () => {
+    const hit = document.evaluate(".//*[contains(text(), 'Ready') or contains(text(), 'READY')]", root, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (hit) { obs.disconnect(); clearTimeout(timer); cb(true); return true; }
+    return false;
+};
+if (!check()) {
+    obs.observe(root, {childList: true, subtree: true, characterData: true});
+    timer = setTimeout(() => { obs.disconnect(); cb(false); }, timeout);
+}
+"""
+
+
 class FrankaRobotInterface:
     """Core robot interface for authentication, status, and basic operations."""
     
@@ -162,17 +184,25 @@ class FrankaRobotInterface:
             self.logger.warning("⚠️ Could not find brake OPEN button")
             return False
     
+    def wait_for_ready_text(self, timeout: float) -> bool:
+        """Block until 'Ready' is shown, reacting to DOM changes; False on timeout."""
+        try:
+            return bool(self.selenium.execute_async_script_timed(
+                _WAIT_FOR_READY_JS, timeout * 1000, timeout=timeout + 1
+            ))
+        except TimeoutException:
+            return False
+        except WebDriverException as e:
+            self.logger.debug(f"Ready wait failed: {e}")
+            return False
+    
     def wait_for_ready(self) -> None:
         """Wait for robot to reach ready state by checking for 'Ready' text."""
         self.logger.info("⏳ Waiting for robot to be ready...")
         
         for attempt in range(20):
-            ready_elem = self.selenium.try_multiple_locators([
-                (By.XPATH, "//*[contains(text(), 'Ready')]"),
-                (By.XPATH, "//*[contains(text(), 'READY')]"),
-            ], timeout=1)
-            
-            if ready_elem:
+            # Returns as soon as Ready shows up instead of sleeping between checks
+            if self.wait_for_ready_text(timeout=3):
                 self.logger.info("🎯 Robot is READY! 🎉")
                 break
             
@@ -195,8 +225,6 @@ class FrankaRobotInterface:
                 self.logger.info(f"⏳ Still waiting... Issues: {', '.join(blocking_issues)} (attempt {attempt + 1}/20)")
             else:
                 self.logger.info(f"⏳ Waiting for Ready status... (attempt {attempt + 1}/20)")
-            
-            time.sleep(2)
         else:
             self.logger.warning("⚠️ Timeout waiting for robot Ready status")
         
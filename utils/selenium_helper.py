@@ -18,6 +18,47 @@ from selenium.common.exceptions import (
 from .config import Config
 
 
+# Locator strategies that _RACE_LOCATORS_JS can evaluate in the page
+_LOCATOR_KINDS = {
+    By.XPATH: "xpath",
+    By.CSS_SELECTOR: "css",
+    By.TAG_NAME: "css",
+    By.ID: "id",
+    By.CLASS_NAME: "class",
+    By.NAME: "name",
+}
+
+# Resolves with the first element matched by any locator (in priority order),
+# re-checking every animation frame until the timeout expires
+_RACE_LOCATORS_JS = """
+const [defs, timeout] = arguments;
+const cb = arguments[arguments.length - 1];
+const t0 = Date.now();
+const lookup = (kind, sel) => {
+    try {
+        switch (kind) {
+            case "css": return document.querySelector(sel);
+            case "id": return document.getElementById(sel);
+            case "class": return document.getElementsByClassName(sel)[0] || null;
+            case "name": return document.getElementsByName(sel)[0] || null;
+            default: return document.evaluate(sel, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+    } catch (e) {
+        return null;  // Invalid selector: treat as no match
+    }
+};
+const check = () => {
+    for (const [kind, sel] of defs) {
+        const el = lookup(kind, sel);
+        if (el) { cb(el); return; }
+    }
+    if (Date.now() - t0 > timeout) { cb(null); return; }
+    if (document.hidden) { setTimeout(check, 50); } else { requestAnimationFrame(check); }
+};
+check();
+"""
+
 class SeleniumHelper:
     """Enhanced Selenium automation utilities."""
     
@@ -25,16 +66,31 @@ class SeleniumHelper:
         self.driver = driver
         self.config = config
         self.logger = logger
+        self._script_timeout: Optional[float] = None
+    
+    def execute_async_script_timed(self, script: str, *args, timeout: float):
+        """Run execute_async_script allowing it at least timeout seconds.
+        
+        The scripts enforce their own deadlines, so the driver-wide limit is
+        only raised when too short and never lowered, keeping lookups at a
+        single round trip.
+        """
+        if self._script_timeout is None:
+            self._script_timeout = self.driver.timeouts.script
+        if timeout > self._script_timeout:
+            self.driver.set_script_timeout(timeout)
+            self._script_timeout = timeout
+        return self.driver.execute_async_script(script, *args)
     
     def wait_for_element(
         self,
         locator: Tuple[By, str],
-        timeout: int = None,
+        *,
+        timeout: float,
         condition = EC.presence_of_element_located,
         save_debug_on_timeout: bool = True  # NEW PARAMETER
     ) -> WebElement:
         """Wait for element with specified condition."""
-        timeout = timeout or self.config.default_timeout
         try:
             return WebDriverWait(self.driver, timeout).until(condition(locator))
         except TimeoutException:
@@ -92,9 +148,30 @@ class SeleniumHelper:
             return False
 
     def try_multiple_locators(self, locators: List[Tuple[By, str]], timeout: int = None) -> Optional[WebElement]:
-        """Try multiple locators and return first found element - NO DEBUG SPAM."""
+        """Try multiple locators and return first found element - NO DEBUG SPAM.
+        
+        All locators are checked together in the page on every animation frame
+        until one matches, so a miss costs one timeout rather than one per locator.
+        """
         timeout = timeout or self.config.short_timeout
         
+        if any(by not in _LOCATOR_KINDS for by, _ in locators):
+            return self._try_locators_serially(locators, timeout)
+        
+        defs = [[_LOCATOR_KINDS[by], value] for by, value in locators]
+        try:
+            return self.execute_async_script_timed(_RACE_LOCATORS_JS, defs, timeout * 1000, timeout=timeout + 1)
+        except TimeoutException:
+            return None
+        except Exception as e:
+            if "invalid session" in str(e) or "disconnected" in str(e):
+                self.logger.error("❌ Browser crashed during element search")
+            else:
+                self.logger.warning(f"Locators {locators} failed: {e}")
+            return None
+    
+    def _try_locators_serially(self, locators: List[Tuple[By, str]], timeout: int) -> Optional[WebElement]:
+        """Wait for each locator in turn; used for strategies the page script cannot evaluate."""
         for locator in locators:
             try:
                 if not self.is_browser_alive():
@@ -102,7 +179,7 @@ class SeleniumHelper:
                     return None
                 
                 # Don't save debug files for existence checks!
-                return self.wait_for_element(locator, timeout, save_debug_on_timeout=False)
+                return self.wait_for_element(locator, timeout=timeout, save_debug_on_timeout=False)
             except TimeoutException:
                 continue  # Expected - just try next locator
             except Exception as e: